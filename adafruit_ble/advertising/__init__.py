@@ -240,8 +240,9 @@ class Advertisement:
     match_prefixes = ()
     """For Advertisement, :py:attr:`~adafruit_ble.advertising.Advertisement.match_prefixes`
     will always return ``True``. Subclasses may override this value."""
-    # cached bytes of merged prefixes.
+    # cached bytes of merged prefixes, and the class they were merged for.
     _prefix_bytes = None
+    _prefix_bytes_class = None
 
     flags = LazyObjectField(AdvertisingFlags, "flags", advertising_data_type=0x01)
     short_name = String(advertising_data_type=0x08)
@@ -298,10 +299,13 @@ class Advertisement:
         with length headers.
         """
         # Check for deprecated `prefix` class attribute.
-        cls._prefix_bytes = getattr(cls, "prefix", None)
-        # Do merge once and memoize it.
-        if cls._prefix_bytes is None:
-            cls._prefix_bytes = (
+        deprecated_prefix = getattr(cls, "prefix", None)
+        if deprecated_prefix is not None:
+            return deprecated_prefix
+        # Do merge once and memoize it. The memo is tagged with the class it was computed for
+        # so that subclasses don't inherit their parent's merged prefixes.
+        if cls._prefix_bytes_class is not cls:
+            prefix_bytes = (
                 b""
                 if cls.match_prefixes is None
                 else b"".join(
@@ -309,6 +313,9 @@ class Advertisement:
                     for prefix in cls.match_prefixes
                 )
             )
+            # Only mark the memo as this class's once it has been computed successfully.
+            cls._prefix_bytes = prefix_bytes
+            cls._prefix_bytes_class = cls
 
         return cls._prefix_bytes
 
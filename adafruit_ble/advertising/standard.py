@@ -25,7 +25,17 @@ from . import (
 from ..uuid import StandardUUID, VendorUUID
 
 try:
-    from typing import Optional, List, Tuple, Union, Type, Iterator, Iterable, Any
+    from typing import (
+        Optional,
+        List,
+        Tuple,
+        Union,
+        Type,
+        Iterator,
+        Iterable,
+        Any,
+        Dict,
+    )
     from adafruit_ble.uuid import UUID
     from adafruit_ble.services import Service
     from _bleio import ScanEntry
@@ -60,9 +70,9 @@ class BoundServiceList:
         for adt in standard_services:
             if adt in self._advertisement.data_dict:
                 data = self._advertisement.data_dict[adt]
-                for i in range(len(data) // 2):
-                    uuid = StandardUUID(data[2 * i : 2 * (i + 1)])
-                    self._standard_services.append(uuid)
+                # Unpack every 16-bit UUID at once instead of slicing each one out.
+                for uuid16 in struct.unpack_from("<%dH" % (len(data) // 2), data):
+                    self._standard_services.append(StandardUUID(uuid16))
         for adt in vendor_services:
             if adt in self._advertisement.data_dict:
                 data = self._advertisement.data_dict[adt]
@@ -80,13 +90,8 @@ class BoundServiceList:
         if not uuids:
             # uuids is empty
             del self._advertisement.data_dict[adt]
-        uuid_length = uuids[0].size // 8
-        b = bytearray(len(uuids) * uuid_length)
-        i = 0
-        for uuid in uuids:
-            uuid.pack_into(b, i)
-            i += uuid_length
-        self._advertisement.data_dict[adt] = b
+            return
+        self._advertisement.data_dict[adt] = b"".join(bytes(uuid) for uuid in uuids)
 
     def __iter__(self) -> Iterator[UUID]:
         all_services = list(self._standard_services)
@@ -150,12 +155,10 @@ class ServiceList(AdvertisingDataField):
     ) -> None:
         self.standard_services = standard_services
         self.vendor_services = vendor_services
+        self._all_services = tuple(standard_services) + tuple(vendor_services)
 
     def _present(self, obj: UsesServicesAdvertisement) -> bool:
-        for adt in self.standard_services:
-            if adt in obj.data_dict:
-                return True
-        for adt in self.vendor_services:
+        for adt in self._all_services:
             if adt in obj.data_dict:
                 return True
         return False
@@ -167,14 +170,22 @@ class ServiceList(AdvertisingDataField):
     ) -> Union[UsesServicesAdvertisement, Tuple[()], "ServiceList"]:
         if obj is None:
             return self
+        first_adt = self.standard_services[0]
+        bound_lists = getattr(obj, "adv_service_lists", None)
+        # A list that has already been bound has already been checked for presence.
+        if bound_lists is not None and first_adt in bound_lists:
+            return bound_lists[first_adt]
         if not self._present(obj) and not obj.mutable:
             return ()
-        if not hasattr(obj, "adv_service_lists"):
-            obj.adv_service_lists = {}
-        first_adt = self.standard_services[0]
-        if first_adt not in obj.adv_service_lists:
-            obj.adv_service_lists[first_adt] = BoundServiceList(obj, **self.__dict__)
-        return obj.adv_service_lists[first_adt]
+        if bound_lists is None:
+            bound_lists = obj.adv_service_lists = {}
+        bound_list = BoundServiceList(
+            obj,
+            standard_services=self.standard_services,
+            vendor_services=self.vendor_services,
+        )
+        bound_lists[first_adt] = bound_list
+        return bound_list
 
 
 class ProvideServicesAdvertisement(Advertisement):
@@ -249,25 +260,51 @@ class ManufacturerData(AdvertisingDataField):
         self._company_id = company_id
         self._adt = advertising_data_type
 
-        self.data = OrderedDict()  # makes field order match order they are set in
+        self._data = OrderedDict()  # makes field order match order they are set in
+        # Encoded data that has not been decoded into _data yet.
+        self._encoded_data = None
         self.company_id = company_id
         encoded_company = struct.pack("<H", company_id)
         if 0xFF in obj.data_dict:
             existing_data = obj.data_dict[0xFF]
             if isinstance(existing_data, list):
+                matched = None
                 for existing in existing_data:
                     if existing.startswith(encoded_company):
-                        existing_data = existing
-                existing_data = None
-            self.data = decode_data(existing_data[2:], key_encoding=key_encoding)
+                        matched = existing
+                        break
+                existing_data = matched
+            if existing_data is not None:
+                # Defer decoding until the data is actually used.
+                self._encoded_data = existing_data[2:]
         self._key_encoding = key_encoding
 
+    @property
+    def data(self) -> Dict[Any, Union[bytes, List[bytes]]]:
+        """The manufacturer specific data, keyed by the key encoding."""
+        if self._encoded_data is not None:
+            self._data = decode_data(
+                self._encoded_data, key_encoding=self._key_encoding
+            )
+            self._encoded_data = None
+        return self._data
+
+    @data.setter
+    def data(self, value: Dict[Any, Union[bytes, List[bytes]]]) -> None:
+        self._data = value
+        self._encoded_data = None
+
     def __len__(self) -> int:
-        return 2 + compute_length(self.data, key_encoding=self._key_encoding)
+        if self._encoded_data is not None:
+            return 2 + len(self._encoded_data)
+        return 2 + compute_length(self._data, key_encoding=self._key_encoding)
 
     def __bytes__(self) -> bytes:
-        return struct.pack("<H", self.company_id) + encode_data(
-            self.data, key_encoding=self._key_encoding
+        encoded_company = struct.pack("<H", self.company_id)
+        if self._encoded_data is not None:
+            return encoded_company + bytes(self._encoded_data)
+        return encoded_company + encode_data(
+            self._data, key_encoding=self._key_encoding
         )
 
     def __str__(self) -> str:
@@ -278,10 +315,19 @@ class ManufacturerData(AdvertisingDataField):
 
 
 class ManufacturerDataField:
-    """A single piece of data within the manufacturer specific data. The format can be repeated."""
+    """A single piece of data within the manufacturer specific data. The format can be repeated.
+
+    When ``field_names`` are given, single entries are returned as a namedtuple. Pass
+    ``use_namedtuple=False`` to get a plain tuple instead, which is cheaper to construct.
+    """
 
     def __init__(
-        self, key: int, value_format: str, field_names: Optional[Iterable[str]] = None
+        self,
+        key: int,
+        value_format: str,
+        field_names: Optional[Iterable[str]] = None,
+        *,
+        use_namedtuple: bool = True
     ) -> None:
         self._key = key
         self._format = value_format
@@ -296,7 +342,8 @@ class ManufacturerDataField:
             )
         self._entry_length = struct.calcsize(value_format)
         self.field_names = field_names
-        if field_names:
+        self.mdf_tuple = None
+        if field_names and use_namedtuple:
             # Mostly, this is to raise a ValueError if field_names has invalid entries
             self.mdf_tuple = namedtuple("mdf_tuple", self.field_names)
 
@@ -311,8 +358,8 @@ class ManufacturerDataField:
         if self._entry_length == len(packed):
             unpacked = struct.unpack_from(self._format, packed)
             if self.element_count == 1:
-                unpacked = unpacked[0]
-            if self.field_names and len(self.field_names) == len(unpacked):
+                return unpacked[0]
+            if self.mdf_tuple is not None and len(self.field_names) == len(unpacked):
                 # If we have field names, we should already have a namedtuple type to use
                 # Unless the element count is off, which... werid.
                 return self.mdf_tuple(*unpacked)
@@ -321,9 +368,10 @@ class ManufacturerDataField:
             raise RuntimeError("Invalid data length")
         entry_count = len(packed) // self._entry_length
         unpacked = [None] * entry_count
+        unpack_from = struct.unpack_from
         for i in range(entry_count):
             offset = i * self._entry_length
-            unpacked[i] = struct.unpack_from(self._format, packed, offset=offset)
+            unpacked[i] = unpack_from(self._format, packed, offset=offset)
             if self.element_count == 1:
                 unpacked[i] = unpacked[i][0]
         return tuple(unpacked)
@@ -335,12 +383,13 @@ class ManufacturerDataField:
             self.element_count == 1 or isinstance(value[0], tuple)
         ):
             packed = bytearray(self._entry_length * len(value))
+            pack_into = struct.pack_into
             for i, entry in enumerate(value):
                 offset = i * self._entry_length
                 if self.element_count > 1:
-                    struct.pack_into(self._format, packed, offset, *entry)
+                    pack_into(self._format, packed, offset, *entry)
                 else:
-                    struct.pack_into(self._format, packed, offset, entry)
+                    pack_into(self._format, packed, offset, entry)
             obj.manufacturer_data.data[self._key] = bytes(packed)
         elif self.element_count == 1:
             obj.manufacturer_data.data[self._key] = struct.pack(self._format, value)
@@ -45,7 +45,7 @@ class Attribute:
 
     .. data:: SIGNED_WITH_MITM
 
-       security_mode: authenticated data signing, without man-in-the-middle protection
+       security_mode: authenticated data signing, with man-in-the-middle protection
     """
 
     # pylint: disable=too-few-public-methods
@@ -55,4 +55,15 @@ class Attribute:
     ENCRYPT_WITH_MITM = _bleio.Attribute.ENCRYPT_WITH_MITM
     LESC_ENCRYPT_WITH_MITM = _bleio.Attribute.LESC_ENCRYPT_WITH_MITM
     SIGNED_NO_MITM = _bleio.Attribute.SIGNED_NO_MITM
-    SIGNED_WITH_MITM = _bleio.Attribute.SIGNED_NO_MITM
+    SIGNED_WITH_MITM = _bleio.Attribute.SIGNED_WITH_MITM
+
+
+# Module level aliases of the security modes so that they can be imported and used directly
+# without going through the Attribute class.
+NO_ACCESS = Attribute.NO_ACCESS
+OPEN = Attribute.OPEN
+ENCRYPT_NO_MITM = Attribute.ENCRYPT_NO_MITM
+ENCRYPT_WITH_MITM = Attribute.ENCRYPT_WITH_MITM
+LESC_ENCRYPT_WITH_MITM = Attribute.LESC_ENCRYPT_WITH_MITM
+SIGNED_NO_MITM = Attribute.SIGNED_NO_MITM
+SIGNED_WITH_MITM = Attribute.SIGNED_WITH_MITM
@@ -13,7 +13,7 @@ from __future__ import annotations
 import struct
 import _bleio
 
-from ..attributes import Attribute
+from ..attributes import Attribute, OPEN
 
 try:
     from typing import Optional, Type, Union, Tuple, Iterable, TYPE_CHECKING
@@ -29,8 +29,95 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 
+try:
+    from struct import Struct as _Struct
+except ImportError:
+    # CircuitPython's struct module doesn't provide Struct. Characteristics call the module
+    # level functions with their format string instead, which is a single C call.
+    _Struct = None
+
+
+try:
+    _StructError = struct.error
+except AttributeError:
+    # MicroPython's struct raises ValueError instead.
+    _StructError = ValueError
+
+
+# Structs are immutable so every characteristic with the same format can share one.
+_structs = {}
+
+
+def _make_struct(struct_format: str) -> Optional[_Struct]:
+    """Returns a shared `struct.Struct` for the format, or None when Struct isn't available."""
+    if _Struct is None:
+        return None
+    compiled = _structs.get(struct_format)
+    if compiled is None:
+        compiled = _structs[struct_format] = _Struct(struct_format)
+    return compiled
+
+
+# All-zero default values, shared by every characteristic of the same max_length.
+_zero_values = {}
 
-class Characteristic:
+
+def _zero_value(length: int) -> bytes:
+    """Returns a shared, all-zero bytes object of the given length."""
+    value = _zero_values.get(length)
+    if value is None:
+        value = _zero_values[length] = bytes(length)
+    return value
+
+
+# Module level aliases of the characteristic properties, for use without the class lookup.
+BROADCAST = _bleio.Characteristic.BROADCAST
+INDICATE = _bleio.Characteristic.INDICATE
+NOTIFY = _bleio.Characteristic.NOTIFY
+READ = _bleio.Characteristic.READ
+WRITE = _bleio.Characteristic.WRITE
+WRITE_NO_RESPONSE = _bleio.Characteristic.WRITE_NO_RESPONSE
+
+
+class _CharacteristicBase:
+    """Settings shared by `Characteristic` and `ComplexCharacteristic`."""
+
+    # pylint: disable=too-few-public-methods
+    __slots__ = (
+        "field_name",
+        "uuid",
+        "properties",
+        "read_perm",
+        "write_perm",
+        "max_length",
+        "fixed_length",
+        "initial_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        uuid: Optional[UUID] = None,
+        properties: int = 0,
+        read_perm: int = OPEN,
+        write_perm: int = OPEN,
+        max_length: Optional[int] = None,
+        fixed_length: bool = False,
+        initial_value: Optional[ReadableBuffer] = None,
+    ) -> None:
+        self.field_name = None  # Set by Service during basic binding
+
+        if uuid:
+            self.uuid = uuid
+        self.properties = properties
+        self.read_perm = read_perm
+        self.write_perm = write_perm
+        self.max_length = max_length
+        self.fixed_length = fixed_length
+        self.initial_value = initial_value
+
+
+class Characteristic(_CharacteristicBase):
     """
     Top level Characteristic class that does basic binding.
 
@@ -78,52 +165,34 @@ class Characteristic:
 
        property: clients may write this characteristic; no response will be sent back"""
 
-    BROADCAST = _bleio.Characteristic.BROADCAST
-    INDICATE = _bleio.Characteristic.INDICATE
-    NOTIFY = _bleio.Characteristic.NOTIFY
-    READ = _bleio.Characteristic.READ
-    WRITE = _bleio.Characteristic.WRITE
-    WRITE_NO_RESPONSE = _bleio.Characteristic.WRITE_NO_RESPONSE
-
-    def __init__(
-        self,
-        *,
-        uuid: Optional[UUID] = None,
-        properties: int = 0,
-        read_perm: int = Attribute.OPEN,
-        write_perm: int = Attribute.OPEN,
-        max_length: Optional[int] = None,
-        fixed_length: bool = False,
-        initial_value: Optional[ReadableBuffer] = None,
-    ) -> None:
-        self.field_name = None  # Set by Service during basic binding
+    __slots__ = ()
 
-        if uuid:
-            self.uuid = uuid
-        self.properties = properties
-        self.read_perm = read_perm
-        self.write_perm = write_perm
-        self.max_length = max_length
-        self.fixed_length = fixed_length
-        self.initial_value = initial_value
+    BROADCAST = BROADCAST
+    INDICATE = INDICATE
+    NOTIFY = NOTIFY
+    READ = READ
+    WRITE = WRITE
+    WRITE_NO_RESPONSE = WRITE_NO_RESPONSE
 
     def _ensure_bound(
         self, service: Service, initial_value: Optional[bytes] = None
-    ) -> None:
-        """Binds the characteristic to the local Service or remote Characteristic object given."""
-        if self.field_name in service.bleio_characteristics:
-            return
+    ) -> _bleio.Characteristic:
+        """Binds the characteristic to the local Service or remote Characteristic object given.
+        Returns the bound `_bleio.Characteristic`."""
+        bleio_characteristic = service.bleio_characteristics.get(self.field_name)
+        if bleio_characteristic is not None:
+            return bleio_characteristic
         if service.remote:
-            for characteristic in service.bleio_service.characteristics:
-                if characteristic.uuid == self.uuid.bleio_uuid:
-                    bleio_characteristic = characteristic
-                    break
-            else:
+            bleio_characteristic = service.bleio_characteristics_by_uuid.get(
+                self.uuid.bleio_uuid
+            )
+            if bleio_characteristic is None:
                 raise AttributeError("Characteristic not available on remote service")
         else:
             bleio_characteristic = self.__bind_locally(service, initial_value)
 
         service.bleio_characteristics[self.field_name] = bleio_characteristic
+        return bleio_characteristic
 
     def __bind_locally(
         self, service: Service, initial_value: Optional[bytes]
@@ -131,7 +200,7 @@ class Characteristic:
         if initial_value is None:
             initial_value = self.initial_value
         if initial_value is None and self.max_length:
-            initial_value = bytes(self.max_length)
+            initial_value = _zero_value(self.max_length)
         max_length = self.max_length
         if max_length is None and initial_value is None:
             max_length = 0
@@ -156,54 +225,63 @@ class Characteristic:
         # but CPython does. In the CPython case, pretend that it doesn't.
         if service is None:
             return self
-        self._ensure_bound(service)
-        bleio_characteristic = service.bleio_characteristics[self.field_name]
+        # Once bound, a single dict lookup finds the characteristic.
+        bleio_characteristic = service.bleio_characteristics.get(self.field_name)
+        if bleio_characteristic is None:
+            bleio_characteristic = self._ensure_bound(service)
         return bleio_characteristic.value
 
     def __set__(self, service: Service, value: ReadableBuffer) -> None:
-        self._ensure_bound(service, value)
+        bleio_characteristic = service.bleio_characteristics.get(self.field_name)
+        if bleio_characteristic is None:
+            bleio_characteristic = self._ensure_bound(service, value)
+            # A new local characteristic already holds the value it was created with.
+            if value is not None and not service.remote:
+                return
         if value is None:
             value = b""
-        bleio_characteristic = service.bleio_characteristics[self.field_name]
         bleio_characteristic.value = value
 
 
-class ComplexCharacteristic:
+class ComplexCharacteristic(_CharacteristicBase):
     """
     Characteristic class that does complex binding where the subclass returns a full object for
     interacting with the characteristic data. The Characteristic itself will be shadowed once it
     has been bound to the corresponding instance attribute.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
         uuid: Optional[UUID] = None,
         properties: int = 0,
-        read_perm: int = Attribute.OPEN,
-        write_perm: int = Attribute.OPEN,
+        read_perm: int = OPEN,
+        write_perm: int = OPEN,
         max_length: int = 20,
         fixed_length: bool = False,
         initial_value: Optional[ReadableBuffer] = None,
     ) -> None:
-        self.field_name = None  # Set by Service during basic binding
-
-        if uuid:
-            self.uuid = uuid
-        self.properties = properties
-        self.read_perm = read_perm
-        self.write_perm = write_perm
-        self.max_length = max_length
-        self.fixed_length = fixed_length
-        self.initial_value = initial_value
+        super().__init__(
+            uuid=uuid,
+            properties=properties,
+            read_perm=read_perm,
+            write_perm=write_perm,
+            max_length=max_length,
+            fixed_length=fixed_length,
+            initial_value=initial_value,
+        )
 
     def bind(self, service: Service) -> _bleio.Characteristic:
         """Binds the characteristic to the local Service or remote Characteristic object given."""
         if service.remote:
-            for characteristic in service.bleio_service.characteristics:
-                if characteristic.uuid == self.uuid.bleio_uuid:
-                    return characteristic
-            raise AttributeError("Characteristic not available on remote service")
+            characteristic = service.bleio_characteristics_by_uuid.get(
+                self.uuid.bleio_uuid
+            )
+            if characteristic is None:
+                raise AttributeError("Characteristic not available on remote service")
+            return characteristic
         return _bleio.Characteristic.add_to_service(
             service.bleio_service,
             self.uuid.bleio_uuid,
@@ -235,26 +313,31 @@ class StructCharacteristic(Characteristic):
     :param int read_perm: see `Characteristic`
     :param int write_perm: see `Characteristic`
     :param buf initial_value: see `Characteristic`
+
+    Values are set as an iterable of the fields to pack. A bytes-like value that is exactly the
+    size of the format is assumed to already be packed and is written unchanged.
     """
 
+    __slots__ = ("_struct_format", "_struct")
+
     def __init__(
         self,
         struct_format,
         *,
         uuid: Optional[UUID] = None,
         properties: int = 0,
-        read_perm: int = Attribute.OPEN,
-        write_perm: int = Attribute.OPEN,
+        read_perm: int = OPEN,
+        write_perm: int = OPEN,
         initial_value: Optional[ReadableBuffer] = None,
     ) -> None:
         self._struct_format = struct_format
-        self._expected_size = struct.calcsize(struct_format)
+        self._struct = _make_struct(struct_format)
         if initial_value is not None:
-            initial_value = struct.pack(self._struct_format, *initial_value)
+            initial_value = struct.pack(struct_format, *initial_value)
         super().__init__(
             uuid=uuid,
             initial_value=initial_value,
-            max_length=self._expected_size,
+            max_length=struct.calcsize(struct_format),
             fixed_length=True,
             properties=properties,
             read_perm=read_perm,
@@ -267,10 +350,35 @@ class StructCharacteristic(Characteristic):
         if obj is None:
             return self
         raw_data = super().__get__(obj, cls)
-        if len(raw_data) < self._expected_size:
+        # unpack_from reads the leading bytes in place, so a remote value that is longer than
+        # expected doesn't need to be sliced first. Short values are rare, so let struct catch
+        # them rather than checking the length on every read.
+        try:
+            if self._struct is None:
+                return struct.unpack_from(self._struct_format, raw_data)
+            return self._struct.unpack_from(raw_data)
+        except _StructError:
             return None
-        return struct.unpack(self._struct_format, raw_data)
 
-    def __set__(self, obj: Service, value: Iterable) -> None:
-        encoded = struct.pack(self._struct_format, *value)
+    def _get_single(
+        self, obj: Service, cls: Optional[Type[Service]] = None
+    ) -> Union[int, float]:
+        """Reads the value of a single field format without the tuple handling of `__get__`."""
+        raw_data = Characteristic.__get__(self, obj, cls)
+        if self._struct is None:
+            return struct.unpack_from(self._struct_format, raw_data)[0]
+        return self._struct.unpack_from(raw_data)[0]
+
+    def __set__(self, obj: Service, value: Union[Iterable, ReadableBuffer]) -> None:
+        # Values that are already packed into the wire format are written as is.
+        if (
+            isinstance(value, (bytes, bytearray, memoryview))
+            and len(value) == self.max_length
+        ):
+            super().__set__(obj, value)
+            return
+        if self._struct is None:
+            encoded = struct.pack(self._struct_format, *value)
+        else:
+            encoded = self._struct.pack(*value)
         super().__set__(obj, encoded)
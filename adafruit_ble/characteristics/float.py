@@ -12,8 +12,10 @@ This module provides float characteristics that are usable directly as attribute
 
 from __future__ import annotations
 
+import struct
+
 from . import Attribute
-from . import StructCharacteristic
+from . import Characteristic, StructCharacteristic
 
 try:
     from typing import Optional, Type, Union, TYPE_CHECKING
@@ -33,6 +35,8 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 class FloatCharacteristic(StructCharacteristic):
     """32-bit float"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -42,23 +46,27 @@ class FloatCharacteristic(StructCharacteristic):
         write_perm: int = Attribute.OPEN,
         initial_value: Optional[ReadableBuffer] = None,
     ) -> None:
-        if initial_value is not None:
-            initial_value = (initial_value,)
         super().__init__(
             "<f",
             uuid=uuid,
             properties=properties,
             read_perm=read_perm,
             write_perm=write_perm,
-            initial_value=initial_value,
         )
+        if initial_value is not None:
+            # Pack the float directly rather than through a 1-tuple.
+            self.initial_value = struct.pack(self._struct_format, initial_value)
 
     def __get__(
         self, obj: Optional[Service], cls: Optional[Type[Service]] = None
     ) -> Union[float, "FloatCharacteristic"]:
         if obj is None:
             return self
-        return super().__get__(obj)[0]
+        return self._get_single(obj, cls)
 
     def __set__(self, obj: Service, value: float) -> None:
-        super().__set__(obj, (value,))
+        if self._struct is None:
+            encoded = struct.pack(self._struct_format, value)
+        else:
+            encoded = self._struct.pack(value)
+        Characteristic.__set__(self, obj, encoded)
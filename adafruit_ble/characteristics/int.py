@@ -12,8 +12,10 @@ This module provides integer characteristics that are usable directly as attribu
 
 from __future__ import annotations
 
+import struct
+
 from . import Attribute
-from . import StructCharacteristic
+from . import Characteristic, StructCharacteristic
 
 try:
     from typing import Optional, Type, Union, TYPE_CHECKING
@@ -33,6 +35,8 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 class IntCharacteristic(StructCharacteristic):
     """Superclass for different kinds of integer fields."""
 
+    __slots__ = ("_min_value", "_max_value")
+
     def __init__(
         self,
         format_string: str,
@@ -50,7 +54,6 @@ class IntCharacteristic(StructCharacteristic):
         if initial_value is not None:
             if not self._min_value <= initial_value <= self._max_value:
                 raise ValueError("initial_value out of range")
-            initial_value = (initial_value,)
 
         super().__init__(
             format_string,
@@ -58,75 +61,109 @@ class IntCharacteristic(StructCharacteristic):
             properties=properties,
             read_perm=read_perm,
             write_perm=write_perm,
-            initial_value=initial_value,
         )
+        if initial_value is not None:
+            # Pack the integer directly rather than through a 1-tuple.
+            self.initial_value = struct.pack(self._struct_format, initial_value)
 
     def __get__(
         self, obj: Optional[Service], cls: Optional[Type[Service]] = None
     ) -> Union[int, "IntCharacteristic"]:
         if obj is None:
             return self
-        return super().__get__(obj)[0]
+        return self._get_single(obj, cls)
 
     def __set__(self, obj: Service, value: int) -> None:
         if not self._min_value <= value <= self._max_value:
             raise ValueError("out of range")
-        super().__set__(obj, (value,))
+        if self._struct is None:
+            encoded = struct.pack(self._struct_format, value)
+        else:
+            encoded = self._struct.pack(value)
+        Characteristic.__set__(self, obj, encoded)
 
 
-class Int8Characteristic(IntCharacteristic):
-    """Int8 number."""
+class _SizedIntCharacteristic(IntCharacteristic):
+    """Base for the fixed size integer characteristics. Subclasses set ``_FORMAT``, ``_MIN``
+    and ``_MAX`` instead of each defining their own ``__init__``."""
 
     # pylint: disable=too-few-public-methods
+    __slots__ = ()
+
+    _FORMAT = None
+    _MIN = None
+    _MAX = None
+
     def __init__(
-        self, *, min_value: int = -128, max_value: int = 127, **kwargs
+        self,
+        *,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        **kwargs,
     ) -> None:
-        super().__init__("<b", min_value, max_value, **kwargs)
+        super().__init__(
+            self._FORMAT,
+            self._MIN if min_value is None else min_value,
+            self._MAX if max_value is None else max_value,
+            **kwargs,
+        )
+
 
+class Int8Characteristic(_SizedIntCharacteristic):
+    """Int8 number."""
 
-class Uint8Characteristic(IntCharacteristic):
+    # pylint: disable=too-few-public-methods
+    __slots__ = ()
+    _FORMAT = "<b"
+    _MIN = -128
+    _MAX = 127
+
+
+class Uint8Characteristic(_SizedIntCharacteristic):
     """Uint8 number."""
 
     # pylint: disable=too-few-public-methods
-    def __init__(self, *, min_value: int = 0, max_value: int = 0xFF, **kwargs) -> None:
-        super().__init__("<B", min_value, max_value, **kwargs)
+    __slots__ = ()
+    _FORMAT = "<B"
+    _MIN = 0
+    _MAX = 0xFF
 
 
-class Int16Characteristic(IntCharacteristic):
+class Int16Characteristic(_SizedIntCharacteristic):
     """Int16 number."""
 
     # pylint: disable=too-few-public-methods
-    def __init__(
-        self, *, min_value: int = -32768, max_value: int = 32767, **kwargs
-    ) -> None:
-        super().__init__("<h", min_value, max_value, **kwargs)
+    __slots__ = ()
+    _FORMAT = "<h"
+    _MIN = -32768
+    _MAX = 32767
 
 
-class Uint16Characteristic(IntCharacteristic):
+class Uint16Characteristic(_SizedIntCharacteristic):
     """Uint16 number."""
 
     # pylint: disable=too-few-public-methods
-    def __init__(
-        self, *, min_value: int = 0, max_value: int = 0xFFFF, **kwargs
-    ) -> None:
-        super().__init__("<H", min_value, max_value, **kwargs)
+    __slots__ = ()
+    _FORMAT = "<H"
+    _MIN = 0
+    _MAX = 0xFFFF
 
 
-class Int32Characteristic(IntCharacteristic):
+class Int32Characteristic(_SizedIntCharacteristic):
     """Int32 number."""
 
     # pylint: disable=too-few-public-methods
-    def __init__(
-        self, *, min_value: int = -2147483648, max_value: int = 2147483647, **kwargs
-    ) -> None:
-        super().__init__("<i", min_value, max_value, **kwargs)
+    __slots__ = ()
+    _FORMAT = "<i"
+    _MIN = -2147483648
+    _MAX = 2147483647
 
 
-class Uint32Characteristic(IntCharacteristic):
+class Uint32Characteristic(_SizedIntCharacteristic):
     """Uint32 number."""
 
     # pylint: disable=too-few-public-methods
-    def __init__(
-        self, *, min_value: int = 0, max_value: int = 0xFFFFFFFF, **kwargs
-    ) -> None:
-        super().__init__("<I", min_value, max_value, **kwargs)
+    __slots__ = ()
+    _FORMAT = "<I"
+    _MIN = 0
+    _MAX = 0xFFFFFFFF
@@ -30,10 +30,27 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 
+# Encoded form of None, the default initial value.
+_NULL = b"null"
+
+# Leave out the whitespace after separators to keep payloads small. Both encoders below use the
+# same separators so a value encodes to the same bytes on every platform.
+_SEPARATORS = (",", ":")
+
+try:
+    # Reuse one encoder.
+    _encode = json.JSONEncoder(separators=_SEPARATORS).encode
+except AttributeError:
+    # CircuitPython's json module has no JSONEncoder, but its dumps takes separators.
+    def _encode(value: Any) -> str:
+        return json.dumps(value, separators=_SEPARATORS)
+
 
 class JSONCharacteristic(Characteristic):
     """JSON string characteristic for JSON serializable values of a limited size (max_length)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -56,12 +73,16 @@ class JSONCharacteristic(Characteristic):
     @staticmethod
     def pack(value: Any) -> bytes:
         """Converts a JSON serializable python value into a utf-8 encoded JSON string."""
-        return json.dumps(value).encode("utf-8")
+        if value is None:
+            return _NULL
+        return _encode(value).encode("utf-8")
 
     @staticmethod
     def unpack(value: ReadableBuffer) -> Any:
         """Converts a utf-8 encoded JSON string into a python value."""
-        return json.loads(str(value, "utf-8"))
+        # _bleio gives a bytearray here on CircuitPython. Both CPython's and CircuitPython's
+        # json.loads accept bytes and bytearray directly, so no str is built first.
+        return json.loads(value)
 
     def __get__(
         self, obj: Optional[Service], cls: Optional[Type[Service]] = None
@@ -14,6 +14,7 @@ object they are on.
 from __future__ import annotations
 
 import _bleio
+from micropython import const
 
 from . import Attribute
 from . import Characteristic
@@ -34,24 +35,47 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 
+_DEFAULT_CHUNK_SIZE = const(20)
+"""Data bytes that fit in a single packet with the default BLE 4.x ATT MTU of 23."""
+
 
 class BoundWriteStream:
-    """Writes data out to the peer."""
+    """Writes data out to the peer.
+
+    :param int chunk_size: The largest write to make at once. Defaults to 20, which always fits in
+      a single packet. Use a larger size only when the connection has negotiated a larger MTU.
+    """
+
+    __slots__ = ("bound_characteristic", "chunk_size")
 
-    def __init__(self, bound_characteristic: Characteristic) -> None:
+    def __init__(
+        self,
+        bound_characteristic: Characteristic,
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
         self.bound_characteristic = bound_characteristic
+        self.chunk_size = chunk_size
 
     def write(self, buf: ReadableBuffer) -> None:
         """Write data from buf out to the peer."""
-        # We can only write 20 bytes at a time.
-        offset = 0
-        while offset < len(buf):
-            self.bound_characteristic.value = buf[offset : offset + 20]
-            offset += 20
+        # We can only write chunk_size bytes at a time. Slices of a memoryview don't copy the data.
+        chunk_size = self.chunk_size
+        bound_characteristic = self.bound_characteristic
+        buf = memoryview(buf)
+        for offset in range(0, len(buf), chunk_size):
+            bound_characteristic.value = buf[offset : offset + chunk_size]
 
 
 class StreamOut(ComplexCharacteristic):
-    """Output stream from the Service server."""
+    """Output stream from the Service server.
+
+    :param int chunk_size: The largest write the bound `BoundWriteStream` makes at once.
+    """
+
+    __slots__ = ("_timeout", "_buffer_size", "_chunk_size")
 
     def __init__(
         self,
@@ -62,9 +86,11 @@ class StreamOut(ComplexCharacteristic):
         properties: int = Characteristic.NOTIFY,
         read_perm: int = Attribute.OPEN,
         write_perm: int = Attribute.OPEN,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
     ) -> None:
         self._timeout = timeout
         self._buffer_size = buffer_size
+        self._chunk_size = chunk_size
         super().__init__(
             uuid=uuid,
             properties=properties,
@@ -86,11 +112,16 @@ class StreamOut(ComplexCharacteristic):
                 timeout=self._timeout,
                 buffer_size=self._buffer_size,
             )
-        return BoundWriteStream(bound_characteristic)
+        return BoundWriteStream(bound_characteristic, chunk_size=self._chunk_size)
 
 
 class StreamIn(ComplexCharacteristic):
-    """Input stream into the Service server."""
+    """Input stream into the Service server.
+
+    :param int chunk_size: The largest write the bound `BoundWriteStream` makes at once.
+    """
+
+    __slots__ = ("_timeout", "_buffer_size", "_chunk_size")
 
     def __init__(
         self,
@@ -100,9 +131,11 @@ class StreamIn(ComplexCharacteristic):
         buffer_size: int = 64,
         properties: int = (Characteristic.WRITE | Characteristic.WRITE_NO_RESPONSE),
         write_perm: int = Attribute.OPEN,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
     ) -> None:
         self._timeout = timeout
         self._buffer_size = buffer_size
+        self._chunk_size = chunk_size
         super().__init__(
             uuid=uuid,
             properties=properties,
@@ -118,7 +151,7 @@ class StreamIn(ComplexCharacteristic):
         bound_characteristic = super().bind(service)
         # If the service is remote need to write out.
         if service.remote:
-            return BoundWriteStream(bound_characteristic)
+            return BoundWriteStream(bound_characteristic, chunk_size=self._chunk_size)
         # We're the server so buffer incoming writes.
         return _bleio.CharacteristicBuffer(
             bound_characteristic, timeout=self._timeout, buffer_size=self._buffer_size
@@ -33,6 +33,10 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 class StringCharacteristic(Characteristic):
     """UTF-8 Encoded string characteristic."""
 
+    # The last string written and its encoding, reused when the same string is written again.
+    # Kept as one tuple so that concurrent writers can't leave a mismatched pair behind.
+    __slots__ = ("_last",)
+
     def __init__(
         self,
         *,
@@ -51,6 +55,7 @@ class StringCharacteristic(Characteristic):
             fixed_length=False,
             initial_value=initial_value,
         )
+        self._last = ("", b"")
 
     def __get__(
         self, obj: Optional[Service], cls: Optional[Type[Service]] = None
@@ -60,12 +65,17 @@ class StringCharacteristic(Characteristic):
         return str(super().__get__(obj, cls), "utf-8")
 
     def __set__(self, obj: Service, value: str) -> None:
-        super().__set__(obj, value.encode("utf-8"))
+        cached = self._last
+        if value is not cached[0]:
+            cached = self._last = (value, value.encode("utf-8"))
+        super().__set__(obj, cached[1])
 
 
 class FixedStringCharacteristic(Characteristic):
     """Fixed strings are set once when bound and unchanged after."""
 
+    __slots__ = ()
+
     def __init__(
         self, *, uuid: Optional[UUID] = None, read_perm: int = Attribute.OPEN
     ) -> None:
@@ -58,6 +58,15 @@ class Service:
         # Service so that the lifetime of the objects is the same as the Service.
         self.bleio_characteristics = {}
 
+        # Remote characteristics indexed by UUID so that binding doesn't scan them all. The first
+        # characteristic wins when a UUID is repeated.
+        self.bleio_characteristics_by_uuid = {}
+        if self.remote:
+            by_uuid = self.bleio_characteristics_by_uuid
+            for characteristic in self.bleio_service.characteristics:
+                if characteristic.uuid not in by_uuid:
+                    by_uuid[characteristic.uuid] = characteristic
+
         # Set the field name on all of the characteristic objects so they can replace themselves if
         # they choose.
         # TODO: Replace this with __set_name__ support.
@@ -11,7 +11,6 @@
 
 from __future__ import annotations
 
-import binascii
 import os
 import sys
 
@@ -64,9 +63,9 @@ class DeviceInfoService(Service):
                 try:
                     import microcontroller  # pylint: disable=import-outside-toplevel
 
-                    serial_number = binascii.hexlify(
-                        microcontroller.cpu.uid  # pylint: disable=no-member
-                    ).decode("utf-8")
+                    serial_number = (
+                        microcontroller.cpu.uid.hex()  # pylint: disable=no-member
+                    )
                 except ImportError:
                     pass
             if firmware_revision is None:
@@ -75,13 +74,18 @@ class DeviceInfoService(Service):
                 # These values are not necessarily valid according to the spec,
                 # but they work on Android and iOS.
                 pnp_id = (0x00, 0x0000, 0x0000, 0x0000)
-        super().__init__(
-            manufacturer=manufacturer,
-            software_revision=software_revision,
-            model_number=model_number,
-            serial_number=serial_number,
-            firmware_revision=firmware_revision,
-            hardware_revision=hardware_revision,
-            pnp_id=pnp_id,
-            service=service,
-        )
+        # Only pass the values that are set. Unset characteristics are still bound by Service
+        # but skip writing an empty value over the one they were just created with.
+        initial_values = {}
+        for name, value in (
+            ("manufacturer", manufacturer),
+            ("software_revision", software_revision),
+            ("model_number", model_number),
+            ("serial_number", serial_number),
+            ("firmware_revision", firmware_revision),
+            ("hardware_revision", hardware_revision),
+            ("pnp_id", pnp_id),
+        ):
+            if value is not None:
+                initial_values[name] = value
+        super().__init__(service=service, **initial_values)
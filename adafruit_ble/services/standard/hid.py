@@ -14,8 +14,6 @@ BLE Human Interface Device (HID)
 
 from __future__ import annotations
 
-import struct
-
 from micropython import const
 import _bleio
 
@@ -200,7 +198,7 @@ class ReportIn:
             _REPORT_REF_DESCR_UUID,
             read_perm=Attribute.ENCRYPT_NO_MITM,
             write_perm=Attribute.NO_ACCESS,
-            initial_value=struct.pack("<BB", self._report_id, _REPORT_TYPE_INPUT),
+            initial_value=bytes((self._report_id, _REPORT_TYPE_INPUT)),
         )
 
     def send_report(self, report: Dict) -> None:
@@ -245,7 +243,7 @@ class ReportOut:
             _REPORT_REF_DESCR_UUID,
             read_perm=Attribute.ENCRYPT_NO_MITM,
             write_perm=Attribute.NO_ACCESS,
-            initial_value=struct.pack("<BB", self._report_id, _REPORT_TYPE_OUTPUT),
+            initial_value=bytes((self._report_id, _REPORT_TYPE_OUTPUT)),
         )
 
     @property
@@ -19,6 +19,9 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE.git"
 class UUID:
     """Top level UUID"""
 
+    # Packed form of the UUID, built on first use by __bytes__.
+    _bytes = None
+
     # TODO: Make subclassing _bleio.UUID work so we can just use it directly.
     # pylint: disable=no-member
     def __hash__(self):
@@ -35,11 +38,14 @@ class UUID:
         return str(self.bleio_uuid)
 
     def __bytes__(self):
-        if self.bleio_uuid.size == 128:
-            return self.bleio_uuid.uuid128
-        b = bytearray(2)
-        self.bleio_uuid.pack_into(b)
-        return bytes(b)
+        if self._bytes is None:
+            if self.bleio_uuid.size == 128:
+                self._bytes = self.bleio_uuid.uuid128
+            else:
+                b = bytearray(2)
+                self.bleio_uuid.pack_into(b)
+                self._bytes = bytes(b)
+        return self._bytes
 
     def pack_into(self, buffer, offset=0):
         """Packs the UUID into the buffer at the given offset."""